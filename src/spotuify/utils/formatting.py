@@ -2,15 +2,20 @@
 
 from typing import Any
 
+# Play count thresholds, largest first
+_SUFFIXES = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+# Spotify provides images in different sizes, largest first
+# Usually: 640x640, 300x300, 64x64
+_SIZE_INDEX = {"large": 0, "medium": 1, "small": 2}
+
 
 def format_duration(ms: int | None) -> str:
     """Format duration from milliseconds to MM:SS format."""
     if ms is None:
         return "--:--"
 
-    total_seconds = ms // 1000
-    minutes = total_seconds // 60
-    seconds = total_seconds % 60
+    minutes, seconds = divmod(ms // 1000, 60)
     return f"{minutes}:{seconds:02d}"
 
 
@@ -35,7 +40,7 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
 
 def format_artist_names(artists: list[dict[str, Any]]) -> str:
     """Format a list of artists to a comma-separated string."""
-    return ", ".join(a.get("name", "Unknown") for a in artists)
+    return ", ".join([a.get("name") or "Unknown" for a in artists])
 
 
 def format_play_count(count: int | None) -> str:
@@ -43,12 +48,9 @@ def format_play_count(count: int | None) -> str:
     if count is None:
         return ""
 
-    if count >= 1_000_000_000:
-        return f"{count / 1_000_000_000:.1f}B"
-    elif count >= 1_000_000:
-        return f"{count / 1_000_000:.1f}M"
-    elif count >= 1_000:
-        return f"{count / 1_000:.1f}K"
+    for threshold, suffix in _SUFFIXES:
+        if count >= threshold:
+            return f"{count / threshold:.1f}{suffix}"
     return str(count)
 
 
@@ -57,14 +59,9 @@ def get_album_art_url(images: list[dict[str, Any]], size: str = "medium") -> str
     if not images:
         return None
 
-    # Spotify provides images in different sizes
-    # Usually: 640x640, 300x300, 64x64
-    if size == "large" and len(images) > 0:
-        return images[0].get("url")
-    elif size == "medium" and len(images) > 1:
-        return images[1].get("url")
-    elif size == "small" and len(images) > 2:
-        return images[2].get("url")
+    index = _SIZE_INDEX.get(size)
+    if index is not None and len(images) > index:
+        return images[index].get("url")
 
     # Fallback to first available
-    return images[0].get("url") if images else None
+    return images[0].get("url")
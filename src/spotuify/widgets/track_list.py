@@ -87,6 +87,15 @@ class TrackList(Static):
         table = self.query_one("#tracks-table", DataTable)
         table.clear()
 
+        # Bind per-row helpers and settings once; this loop runs for every track
+        artist_names = format_artist_names
+        duration_text = format_duration
+        truncate = truncate_text
+        add_row = table.add_row
+        current_track_id = self.current_track_id
+        show_album = self.show_album
+        show_added_at = self.show_added_at
+
         for i, track_item in enumerate(self.tracks, 1):
             # Handle both playlist tracks (with 'track' key) and direct tracks
             track = track_item.get("track") if "track" in track_item else track_item
@@ -96,38 +105,38 @@ class TrackList(Static):
 
             track_id = track.get("id", "")
             name = track.get("name", "Unknown")
-            artists = format_artist_names(track.get("artists", []))
-            album = track.get("album", {}).get("name", "") if self.show_album else ""
-            duration = format_duration(track.get("duration_ms"))
+            artists = artist_names(track.get("artists", []))
+            album = track.get("album", {}).get("name", "") if show_album else ""
+            duration = duration_text(track.get("duration_ms"))
 
             # Check if this is the currently playing track
-            is_current = track_id == self.current_track_id
+            is_current = track_id == current_track_id
 
             # Create styled text for currently playing track
             num_text = Text(f"▶ " if is_current else f"{i}")
             if is_current:
                 num_text.stylize("bold green")
 
-            title_text = Text(truncate_text(name, 28))
+            title_text = Text(truncate(name, 28))
             if is_current:
                 title_text.stylize("bold green")
 
             row_data = [
                 num_text,
                 title_text,
-                truncate_text(artists, 23),
+                truncate(artists, 23),
             ]
 
-            if self.show_album:
-                row_data.append(truncate_text(album, 23))
+            if show_album:
+                row_data.append(truncate(album, 23))
 
             row_data.append(duration)
 
-            if self.show_added_at:
+            if show_added_at:
                 added_at = track_item.get("added_at", "")[:10] if "added_at" in track_item else ""
                 row_data.append(added_at)
 
-            table.add_row(*row_data, key=track_id)
+            add_row(*row_data, key=track_id)
 
     def set_current_track(self, track_id: str | None) -> None:
         """Set the currently playing track."""
@@ -2,133 +2,161 @@
 
 import json
 import pytest
+import pytest_asyncio
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import cache
 from pathlib import Path
-from typing import Any, Generator
-from unittest.mock import MagicMock, AsyncMock, patch
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import MagicMock, patch
 
-# Sample Spotify API response data for testing
+import textual._wait
+from textual.app import App, ComposeResult
+from textual.pilot import Pilot
+from textual.widget import Widget
 
+from spotuify.screens import DevicesScreen, HelpScreen, LibraryScreen, MainScreen, SearchScreen
+from spotuify.widgets.volume_bar import VolumeBar
 
-@pytest.fixture
-def sample_track() -> dict[str, Any]:
+# Sample Spotify API response data for testing. These are session-scoped and
+# read-only; tests that need a variation should build a copy, e.g.
+# dict(sample_playback_state, is_playing=False).
+
+
+def _frozen(value: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def sample_track() -> Mapping[str, Any]:
     """Sample track data from Spotify API."""
-    return {
-        "id": "track123",
-        "name": "Test Track",
-        "uri": "spotify:track:track123",
-        "duration_ms": 210000,  # 3:30
-        "artists": [
-            {"id": "artist1", "name": "Test Artist"},
-            {"id": "artist2", "name": "Featured Artist"},
-        ],
-        "album": {
+    return _frozen(
+        {
+            "id": "track123",
+            "name": "Test Track",
+            "uri": "spotify:track:track123",
+            "duration_ms": 210000,  # 3:30
+            "artists": [
+                {"id": "artist1", "name": "Test Artist"},
+                {"id": "artist2", "name": "Featured Artist"},
+            ],
+            "album": {
+                "id": "album123",
+                "name": "Test Album",
+                "images": [
+                    {"url": "https://example.com/large.jpg", "width": 640, "height": 640},
+                    {"url": "https://example.com/medium.jpg", "width": 300, "height": 300},
+                    {"url": "https://example.com/small.jpg", "width": 64, "height": 64},
+                ],
+                "release_date": "2023-01-15",
+            },
+            "popularity": 75,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_track_item(sample_track: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Sample track item as returned in playlists (with 'track' wrapper)."""
+    return _frozen(
+        {
+            "added_at": "2023-06-15T10:30:00Z",
+            "track": sample_track,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_album() -> Mapping[str, Any]:
+    """Sample album data from Spotify API."""
+    return _frozen(
+        {
             "id": "album123",
             "name": "Test Album",
+            "uri": "spotify:album:album123",
+            "album_type": "album",
+            "total_tracks": 12,
+            "release_date": "2023-01-15",
+            "artists": [
+                {"id": "artist1", "name": "Test Artist"},
+            ],
             "images": [
                 {"url": "https://example.com/large.jpg", "width": 640, "height": 640},
                 {"url": "https://example.com/medium.jpg", "width": 300, "height": 300},
-                {"url": "https://example.com/small.jpg", "width": 64, "height": 64},
             ],
-            "release_date": "2023-01-15",
-        },
-        "popularity": 75,
-    }
+            "tracks": {
+                "items": [],
+                "total": 12,
+            },
+        }
+    )
 
 
-@pytest.fixture
-def sample_track_item(sample_track: dict[str, Any]) -> dict[str, Any]:
-    """Sample track item as returned in playlists (with 'track' wrapper)."""
-    return {
-        "added_at": "2023-06-15T10:30:00Z",
-        "track": sample_track,
-    }
-
-
-@pytest.fixture
-def sample_album() -> dict[str, Any]:
-    """Sample album data from Spotify API."""
-    return {
-        "id": "album123",
-        "name": "Test Album",
-        "uri": "spotify:album:album123",
-        "album_type": "album",
-        "total_tracks": 12,
-        "release_date": "2023-01-15",
-        "artists": [
-            {"id": "artist1", "name": "Test Artist"},
-        ],
-        "images": [
-            {"url": "https://example.com/large.jpg", "width": 640, "height": 640},
-            {"url": "https://example.com/medium.jpg", "width": 300, "height": 300},
-        ],
-        "tracks": {
-            "items": [],
-            "total": 12,
-        },
-    }
-
-
-@pytest.fixture
-def sample_artist() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_artist() -> Mapping[str, Any]:
     """Sample artist data from Spotify API."""
-    return {
-        "id": "artist1",
-        "name": "Test Artist",
-        "uri": "spotify:artist:artist1",
-        "genres": ["rock", "alternative", "indie"],
-        "popularity": 80,
-        "followers": {
-            "total": 1500000,
-        },
-        "images": [
-            {"url": "https://example.com/artist_large.jpg", "width": 640, "height": 640},
-        ],
-    }
+    return _frozen(
+        {
+            "id": "artist1",
+            "name": "Test Artist",
+            "uri": "spotify:artist:artist1",
+            "genres": ["rock", "alternative", "indie"],
+            "popularity": 80,
+            "followers": {
+                "total": 1500000,
+            },
+            "images": [
+                {"url": "https://example.com/artist_large.jpg", "width": 640, "height": 640},
+            ],
+        }
+    )
 
 
-@pytest.fixture
-def sample_playlist() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_playlist() -> Mapping[str, Any]:
     """Sample playlist data from Spotify API."""
-    return {
-        "id": "playlist123",
-        "name": "My Test Playlist",
-        "uri": "spotify:playlist:playlist123",
-        "description": "A test playlist for testing purposes",
-        "owner": {
-            "id": "user123",
-            "display_name": "Test User",
-        },
-        "tracks": {
-            "items": [],
-            "total": 50,
-        },
-        "images": [
-            {"url": "https://example.com/playlist.jpg", "width": 300, "height": 300},
-        ],
-        "public": True,
-        "collaborative": False,
-    }
-
-
-@pytest.fixture
-def sample_device() -> dict[str, Any]:
-    """Sample device data from Spotify API."""
-    return {
-        "id": "device123",
-        "name": "My Computer",
-        "type": "Computer",
-        "is_active": True,
-        "is_private_session": False,
-        "is_restricted": False,
-        "volume_percent": 65,
-    }
+    return _frozen(
+        {
+            "id": "playlist123",
+            "name": "My Test Playlist",
+            "uri": "spotify:playlist:playlist123",
+            "description": "A test playlist for testing purposes",
+            "owner": {
+                "id": "user123",
+                "display_name": "Test User",
+            },
+            "tracks": {
+                "items": [],
+                "total": 50,
+            },
+            "images": [
+                {"url": "https://example.com/playlist.jpg", "width": 300, "height": 300},
+            ],
+            "public": True,
+            "collaborative": False,
+        }
+    )
 
 
-@pytest.fixture
-def sample_devices(sample_device: dict[str, Any]) -> list[dict[str, Any]]:
-    """List of sample devices."""
-    return [
-        sample_device,
+SAMPLE_DEVICES: tuple[Mapping[str, Any], ...] = (
+    _frozen(
+        {
+            "id": "device123",
+            "name": "My Computer",
+            "type": "Computer",
+            "is_active": True,
+            "is_private_session": False,
+            "is_restricted": False,
+            "volume_percent": 65,
+        }
+    ),
+    _frozen(
         {
             "id": "device456",
             "name": "Living Room Speaker",
@@ -137,7 +165,9 @@ def sample_devices(sample_device: dict[str, Any]) -> list[dict[str, Any]]:
             "is_private_session": False,
             "is_restricted": False,
             "volume_percent": 50,
-        },
+        }
+    ),
+    _frozen(
         {
             "id": "device789",
             "name": "My Phone",
@@ -146,99 +176,120 @@ def sample_devices(sample_device: dict[str, Any]) -> list[dict[str, Any]]:
             "is_private_session": False,
             "is_restricted": False,
             "volume_percent": 75,
-        },
-    ]
+        }
+    ),
+)
 
 
-@pytest.fixture
-def sample_playback_state(
-    sample_track: dict[str, Any], sample_device: dict[str, Any]
-) -> dict[str, Any]:
-    """Sample playback state from Spotify API."""
-    return {
-        "is_playing": True,
-        "item": sample_track,
-        "device": sample_device,
-        "progress_ms": 45000,  # 0:45
-        "shuffle_state": False,
-        "repeat_state": "off",
-        "context": {
-            "type": "playlist",
-            "uri": "spotify:playlist:playlist123",
-        },
-    }
+@pytest.fixture(scope="session")
+def sample_device() -> Mapping[str, Any]:
+    """Sample device data from Spotify API."""
+    return SAMPLE_DEVICES[0]
 
 
-@pytest.fixture
-def sample_user() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_devices() -> tuple[Mapping[str, Any], ...]:
+    """Tuple of sample devices."""
+    return SAMPLE_DEVICES
+
+
+@pytest.fixture(scope="session")
+def sample_playback_state(
+    sample_track: Mapping[str, Any], sample_device: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    """Sample playback state from Spotify API."""
+    return _frozen(
+        {
+            "is_playing": True,
+            "item": sample_track,
+            "device": sample_device,
+            "progress_ms": 45000,  # 0:45
+            "shuffle_state": False,
+            "repeat_state": "off",
+            "context": {
+                "type": "playlist",
+                "uri": "spotify:playlist:playlist123",
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_user() -> Mapping[str, Any]:
     """Sample user profile data."""
-    return {
-        "id": "user123",
-        "display_name": "Test User",
-        "email": "test@example.com",
-        "country": "US",
-        "product": "premium",
-        "followers": {
-            "total": 100,
-        },
-        "images": [
-            {"url": "https://example.com/user.jpg", "width": 300, "height": 300},
-        ],
-    }
+    return _frozen(
+        {
+            "id": "user123",
+            "display_name": "Test User",
+            "email": "test@example.com",
+            "country": "US",
+            "product": "premium",
+            "followers": {
+                "total": 100,
+            },
+            "images": [
+                {"url": "https://example.com/user.jpg", "width": 300, "height": 300},
+            ],
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_results(
-    sample_track: dict[str, Any],
-    sample_album: dict[str, Any],
-    sample_artist: dict[str, Any],
-    sample_playlist: dict[str, Any],
-) -> dict[str, Any]:
+    sample_track: Mapping[str, Any],
+    sample_album: Mapping[str, Any],
+    sample_artist: Mapping[str, Any],
+    sample_playlist: Mapping[str, Any],
+) -> Mapping[str, Any]:
     """Sample search results from Spotify API."""
-    return {
-        "tracks": {
-            "items": [sample_track],
-            "total": 1,
-            "limit": 20,
-            "offset": 0,
-        },
-        "albums": {
-            "items": [sample_album],
-            "total": 1,
-            "limit": 20,
-            "offset": 0,
-        },
-        "artists": {
-            "items": [sample_artist],
-            "total": 1,
-            "limit": 20,
-            "offset": 0,
-        },
-        "playlists": {
-            "items": [sample_playlist],
-            "total": 1,
-            "limit": 20,
-            "offset": 0,
-        },
-    }
-
-
-@pytest.fixture
-def sample_recently_played(sample_track: dict[str, Any]) -> dict[str, Any]:
+    return _frozen(
+        {
+            "tracks": {
+                "items": [sample_track],
+                "total": 1,
+                "limit": 20,
+                "offset": 0,
+            },
+            "albums": {
+                "items": [sample_album],
+                "total": 1,
+                "limit": 20,
+                "offset": 0,
+            },
+            "artists": {
+                "items": [sample_artist],
+                "total": 1,
+                "limit": 20,
+                "offset": 0,
+            },
+            "playlists": {
+                "items": [sample_playlist],
+                "total": 1,
+                "limit": 20,
+                "offset": 0,
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_recently_played(sample_track: Mapping[str, Any]) -> Mapping[str, Any]:
     """Sample recently played response."""
-    return {
-        "items": [
-            {
-                "track": sample_track,
-                "played_at": "2023-06-15T10:30:00Z",
-                "context": {
-                    "type": "playlist",
-                    "uri": "spotify:playlist:playlist123",
-                },
-            }
-        ],
-        "limit": 50,
-    }
+    return _frozen(
+        {
+            "items": [
+                {
+                    "track": sample_track,
+                    "played_at": "2023-06-15T10:30:00Z",
+                    "context": {
+                        "type": "playlist",
+                        "uri": "spotify:playlist:playlist123",
+                    },
+                }
+            ],
+            "limit": 50,
+        }
+    )
 
 
 @pytest.fixture
@@ -301,3 +352,85 @@ def sample_token_info() -> dict[str, Any]:
         "scope": "user-read-playback-state user-modify-playback-state",
         "expires_at": 9999999999,  # Far future
     }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_textual_idle_wait() -> Generator[None, None, None]:
+    """Shorten the real-time sleep Textual's pilot uses to detect an idle app.
+
+    Pilot.pause() and Pilot.click() poll in textual._wait.wait_for_idle(), which
+    sleeps SLEEP_GRANULARITY (1/50s) per check before comparing wall clock and
+    CPU time. Headless test apps go idle almost immediately, so poll every 2ms.
+    SLEEP_IDLE is derived from the granularity at import time, so scale it too to
+    keep the same "under 5% CPU per poll" idle threshold.
+    """
+    granularity = 1 / 500
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(textual._wait, "SLEEP_GRANULARITY", granularity)
+        mp.setattr(textual._wait, "SLEEP_IDLE", granularity / 20.0)
+        yield
+
+
+class _ScreensTestApp(App):
+    """Bare app with every named screen registered, defined once at import."""
+
+    SCREENS = {
+        "main": MainScreen,
+        "search": SearchScreen,
+        "library": LibraryScreen,
+        "devices": DevicesScreen,
+        "help": HelpScreen,
+    }
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def textual_app() -> AsyncGenerator[Pilot, None]:
+    """Run one Textual app for the session with every screen registered.
+
+    Screen tests push the screen they need onto this app and pop it again
+    afterwards, rather than each starting an app of their own.
+    """
+    async with _ScreensTestApp().run_test() as pilot:
+        yield pilot
+
+
+@cache
+def _make_widget_app(widget_cls: type[Widget], widget_id: str) -> type[App]:
+    """Build a bare app that composes a single widget, once per widget/id."""
+
+    class WidgetTestApp(App):
+        def compose(self) -> ComposeResult:
+            yield widget_cls(id=widget_id)
+
+    return WidgetTestApp
+
+
+@pytest.fixture(scope="module")
+def widget_app_factory() -> Callable[[type[Widget], str], type[App]]:
+    """Return a factory for single-widget test apps, memoized per widget and id."""
+    return _make_widget_app
+
+
+@asynccontextmanager
+async def _mounted_widget(widget_cls: type[Widget], widget_id: str) -> AsyncGenerator[Widget, None]:
+    """Mount a single widget in a 1x1 headless app and yield it."""
+    async with _make_widget_app(widget_cls, widget_id)().run_test(size=(1, 1)) as pilot:
+        yield pilot.app.query_one(f"#{widget_id}", widget_cls)
+
+
+@pytest.fixture(scope="module")
+def make_widget() -> Callable[[type[Widget], str], AbstractAsyncContextManager[Widget]]:
+    """Return a context manager that yields a mounted widget for state-only tests.
+
+    Widgets update their children through query_one, so they need a DOM; a 1x1
+    screen keeps layout and rendering to a minimum. Tests that press keys or
+    click should keep using run_test at the default size.
+    """
+    return _mounted_widget
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def volume_pilot() -> AsyncGenerator[Pilot, None]:
+    """Run one VolumeBar test app per module; state-only tests share its pilot."""
+    async with _make_widget_app(VolumeBar, "volume")().run_test() as pilot:
+        yield pilot
@@ -1,13 +1,210 @@
 """Tests for the Spotify API client module."""
 
+import copy
+import re
 import pytest
+from collections.abc import Generator, Mapping
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import call
 
+import spotipy
+
+import spotuify.utils.config as config_mod
 from spotuify.api.client import SpotifyClient, PlaybackState
 from spotuify.utils.config import Config
 
 
+_NOT_AUTH_RE = re.compile("Not authenticated")
+
+
+class _Recorder:
+    """Descriptor standing in for a single spotipy method."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, stub: "_SpStub | None", owner: type) -> Any:
+        if stub is None:
+            return self
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            stub.calls.setdefault(self.name, []).append(call(*args, **kwargs))
+            if self.name in stub._raises:
+                raise stub._raises[self.name]
+            return stub._returns.get(self.name)
+
+        return method
+
+
+class _SpStub:
+    """Lightweight spotipy.Spotify stand-in that records calls by method name."""
+
+    __slots__ = ("calls", "_returns", "_raises")
+
+    current_playback = _Recorder()
+    start_playback = _Recorder()
+    pause_playback = _Recorder()
+    next_track = _Recorder()
+    previous_track = _Recorder()
+    seek_track = _Recorder()
+    volume = _Recorder()
+    shuffle = _Recorder()
+    repeat = _Recorder()
+    devices = _Recorder()
+    transfer_playback = _Recorder()
+    current_user_playlists = _Recorder()
+    playlist = _Recorder()
+    playlist_tracks = _Recorder()
+    current_user_saved_tracks = _Recorder()
+    current_user_saved_albums = _Recorder()
+    current_user_followed_artists = _Recorder()
+    current_user_saved_tracks_add = _Recorder()
+    current_user_saved_tracks_delete = _Recorder()
+    current_user_saved_tracks_contains = _Recorder()
+    album = _Recorder()
+    album_tracks = _Recorder()
+    artist = _Recorder()
+    artist_top_tracks = _Recorder()
+    artist_albums = _Recorder()
+    search = _Recorder()
+    add_to_queue = _Recorder()
+    queue = _Recorder()
+    current_user = _Recorder()
+    current_user_recently_played = _Recorder()
+
+    def __init__(self) -> None:
+        self.calls: dict[str, list[Any]] = {}
+        self._returns: dict[str, Any] = {}
+        self._raises: dict[str, BaseException] = {}
+
+    def reset(self) -> None:
+        """Forget recorded calls and configured results."""
+        self.calls.clear()
+        self._returns.clear()
+        self._raises.clear()
+
+    def set_return(self, name: str, value: Any) -> None:
+        """Set the value returned by a stubbed method."""
+        self._returns[name] = value
+
+    def set_raise(self, name: str, exc: BaseException) -> None:
+        """Make a stubbed method raise an exception."""
+        self._raises[name] = exc
+
+
+# Returned by the stub for every pass-through call, so methods that hand the
+# spotipy response back can be checked by identity.
+_PAYLOAD: dict[str, Any] = {"id": "payload"}
+
+# (client method, args, kwargs, spotipy method, spotipy args, spotipy kwargs, expected result)
+PASSTHROUGH_CASES = [
+    pytest.param("play", (), {}, "start_playback", (), {"device_id": None}, True, id="play"),
+    pytest.param(
+        "play",
+        (),
+        {"device_id": "device123"},
+        "start_playback",
+        (),
+        {"device_id": "device123"},
+        True,
+        id="play_with_device_id",
+    ),
+    pytest.param("pause", (), {}, "pause_playback", (), {"device_id": None}, True, id="pause"),
+    pytest.param(
+        "next_track", (), {}, "next_track", (), {"device_id": None}, True, id="next_track"
+    ),
+    pytest.param(
+        "previous_track",
+        (),
+        {},
+        "previous_track",
+        (),
+        {"device_id": None},
+        True,
+        id="previous_track",
+    ),
+    pytest.param(
+        "seek", (60000,), {}, "seek_track", (60000,), {"device_id": None}, True, id="seek"
+    ),
+    pytest.param(
+        "set_volume", (75,), {}, "volume", (75,), {"device_id": None}, True, id="set_volume"
+    ),
+    pytest.param(
+        "transfer_playback",
+        ("device123",),
+        {},
+        "transfer_playback",
+        ("device123",),
+        {"force_play": False},
+        True,
+        id="transfer_playback",
+    ),
+    pytest.param(
+        "save_track",
+        ("track123",),
+        {},
+        "current_user_saved_tracks_add",
+        (["track123"],),
+        {},
+        True,
+        id="save_track",
+    ),
+    pytest.param(
+        "remove_saved_track",
+        ("track123",),
+        {},
+        "current_user_saved_tracks_delete",
+        (["track123"],),
+        {},
+        True,
+        id="remove_saved_track",
+    ),
+    pytest.param(
+        "add_to_queue",
+        ("spotify:track:abc123",),
+        {},
+        "add_to_queue",
+        ("spotify:track:abc123",),
+        {"device_id": None},
+        True,
+        id="add_to_queue",
+    ),
+    pytest.param(
+        "get_album", ("album123",), {}, "album", ("album123",), {}, _PAYLOAD, id="get_album"
+    ),
+    pytest.param(
+        "get_artist", ("artist1",), {}, "artist", ("artist1",), {}, _PAYLOAD, id="get_artist"
+    ),
+    pytest.param(
+        "get_current_user", (), {}, "current_user", (), {}, _PAYLOAD, id="get_current_user"
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def _base_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    """Build a single Config for the session under a temporary directory."""
+    base_dir = tmp_path_factory.mktemp("cfg")
+    config_dir = base_dir / "config"
+    cache_dir = base_dir / "cache"
+
+    # Swap the platformdirs lookups directly; they are only consulted in __init__.
+    old_config_dir, old_cache_dir = config_mod.user_config_dir, config_mod.user_cache_dir
+    config_mod.user_config_dir = lambda *args, **kwargs: str(config_dir)
+    config_mod.user_cache_dir = lambda *args, **kwargs: str(cache_dir)
+    try:
+        return Config()
+    finally:
+        config_mod.user_config_dir, config_mod.user_cache_dir = old_config_dir, old_cache_dir
+
+
+@pytest.fixture(scope="session")
+def shared_stub() -> _SpStub:
+    """Single spotipy stub reused by every client test."""
+    return _SpStub()
+
+
 class TestPlaybackState:
     """Tests for PlaybackState dataclass."""
 
@@ -25,7 +222,7 @@ class TestPlaybackState:
         assert state.context is None
 
     def test_playback_state_custom_values(
-        self, sample_track: dict[str, Any], sample_device: dict[str, Any]
+        self, sample_track: Mapping[str, Any], sample_device: Mapping[str, Any]
     ) -> None:
         """Test PlaybackState with custom values."""
         state = PlaybackState(
@@ -38,36 +235,44 @@ class TestPlaybackState:
             repeat_state="track",
             volume_percent=75,
         )
-        assert state.is_playing is True
-        assert state.track == sample_track
-        assert state.device == sample_device
-        assert state.progress_ms == 45000
-        assert state.shuffle_state is True
-        assert state.repeat_state == "track"
-        assert state.volume_percent == 75
+        assert vars(state) == {
+            "is_playing": True,
+            "track": sample_track,
+            "device": sample_device,
+            "progress_ms": 45000,
+            "duration_ms": 210000,
+            "shuffle_state": True,
+            "repeat_state": "track",
+            "volume_percent": 75,
+            "context": None,
+        }
 
 
 class TestSpotifyClient:
     """Tests for SpotifyClient class."""
 
-    @pytest.fixture
-    def mock_config(self, tmp_path: Any) -> Config:
-        """Create a mock config."""
-        config_dir = tmp_path / "config"
-        cache_dir = tmp_path / "cache"
+    @pytest.fixture(scope="class")
+    def mock_config(self, _base_config: Config) -> Config:
+        """Create a configured copy of the session config."""
+        config = copy.deepcopy(_base_config)
+        config.client_id = "test_client_id"
+        config.client_secret = "test_client_secret"
+        return config
 
-        with patch("spotuify.utils.config.user_config_dir", return_value=str(config_dir)):
-            with patch("spotuify.utils.config.user_cache_dir", return_value=str(cache_dir)):
-                config = Config()
-                config.client_id = "test_client_id"
-                config.client_secret = "test_client_secret"
-                return config
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self, mock_config: Config) -> SpotifyClient:
-        """Create a SpotifyClient instance."""
+        """Create a SpotifyClient instance shared by the whole class."""
         return SpotifyClient(mock_config)
 
+    @pytest.fixture(autouse=True)
+    def _reset_client(
+        self, client: SpotifyClient, shared_stub: _SpStub
+    ) -> Generator[None, None, None]:
+        """Detach and reset the stub after each test."""
+        yield
+        client._sp = None
+        shared_stub.reset()
+
     def test_client_init(self, mock_config: Config) -> None:
         """Test client initialization."""
         client = SpotifyClient(mock_config)
@@ -80,41 +285,68 @@ class TestSpotifyClient:
 
     def test_client_is_authenticated_true(self, client: SpotifyClient) -> None:
         """Test is_authenticated when authenticated."""
-        client._sp = MagicMock()
+        client._sp = SimpleNamespace()
         assert client.is_authenticated() is True
 
     def test_client_sp_property_raises_when_not_authenticated(self, client: SpotifyClient) -> None:
         """Test sp property raises when not authenticated."""
-        with pytest.raises(RuntimeError, match="Not authenticated"):
+        with pytest.raises(RuntimeError, match=_NOT_AUTH_RE):
             _ = client.sp
 
     def test_client_sp_property_returns_client(self, client: SpotifyClient) -> None:
         """Test sp property returns client when authenticated."""
-        mock_sp = MagicMock()
+        mock_sp = SimpleNamespace()
         client._sp = mock_sp
-        assert client.sp == mock_sp
+        assert client.sp is mock_sp
 
     def test_ensure_authenticated_raises(self, client: SpotifyClient) -> None:
         """Test _ensure_authenticated raises when not authenticated."""
-        with pytest.raises(RuntimeError, match="Not authenticated"):
+        with pytest.raises(RuntimeError, match=_NOT_AUTH_RE):
             client._ensure_authenticated()
 
     def test_ensure_authenticated_passes(self, client: SpotifyClient) -> None:
         """Test _ensure_authenticated passes when authenticated."""
-        client._sp = MagicMock()
+        client._sp = SimpleNamespace()
         client._ensure_authenticated()  # Should not raise
 
+    # ========================
+    # Pass-through Tests
+    # ========================
+
+    @pytest.mark.parametrize(
+        "method,args,kwargs,sp_method,sp_args,sp_kwargs,expected", PASSTHROUGH_CASES
+    )
+    def test_simple_passthrough(
+        self,
+        client: SpotifyClient,
+        shared_stub: _SpStub,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        sp_method: str,
+        sp_args: tuple[Any, ...],
+        sp_kwargs: dict[str, Any],
+        expected: Any,
+    ) -> None:
+        """Test methods that forward directly to a single spotipy call."""
+        shared_stub.set_return(sp_method, _PAYLOAD)
+        client._sp = shared_stub
+
+        result = getattr(client, method)(*args, **kwargs)
+
+        assert result is expected
+        assert shared_stub.calls[sp_method] == [call(*sp_args, **sp_kwargs)]
+
     # ========================
     # Playback Control Tests
     # ========================
 
     def test_get_playback_state(
-        self, client: SpotifyClient, sample_playback_state: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_playback_state: Mapping[str, Any]
     ) -> None:
         """Test get_playback_state returns correct state."""
-        mock_sp = MagicMock()
-        mock_sp.current_playback.return_value = sample_playback_state
-        client._sp = mock_sp
+        shared_stub.set_return("current_playback", sample_playback_state)
+        client._sp = shared_stub
 
         state = client.get_playback_state()
 
@@ -122,13 +354,12 @@ class TestSpotifyClient:
         assert state.is_playing is True
         assert state.track == sample_playback_state["item"]
         assert state.progress_ms == 45000
-        mock_sp.current_playback.assert_called_once()
+        assert len(shared_stub.calls["current_playback"]) == 1
 
-    def test_get_playback_state_none(self, client: SpotifyClient) -> None:
+    def test_get_playback_state_none(self, client: SpotifyClient, shared_stub: _SpStub) -> None:
         """Test get_playback_state returns empty state when nothing playing."""
-        mock_sp = MagicMock()
-        mock_sp.current_playback.return_value = None
-        client._sp = mock_sp
+        shared_stub.set_return("current_playback", None)
+        client._sp = shared_stub
 
         state = client.get_playback_state()
 
@@ -136,277 +367,173 @@ class TestSpotifyClient:
         assert state.is_playing is False
         assert state.track is None
 
-    def test_get_playback_state_exception(self, client: SpotifyClient) -> None:
+    def test_get_playback_state_exception(
+        self, client: SpotifyClient, shared_stub: _SpStub
+    ) -> None:
         """Test get_playback_state returns None on exception."""
-        import spotipy
-
-        mock_sp = MagicMock()
-        mock_sp.current_playback.side_effect = spotipy.SpotifyException(400, "error")
-        client._sp = mock_sp
+        shared_stub.set_raise("current_playback", spotipy.SpotifyException(400, -1, "error"))
+        client._sp = shared_stub
 
         state = client.get_playback_state()
         assert state is None
 
-    def test_play(self, client: SpotifyClient) -> None:
-        """Test play method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.play()
-
-        assert result is True
-        mock_sp.start_playback.assert_called_once_with(device_id=None)
-
-    def test_play_with_device_id(self, client: SpotifyClient) -> None:
-        """Test play with specific device."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.play(device_id="device123")
-
-        assert result is True
-        mock_sp.start_playback.assert_called_once_with(device_id="device123")
-
-    def test_pause(self, client: SpotifyClient) -> None:
-        """Test pause method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.pause()
-
-        assert result is True
-        mock_sp.pause_playback.assert_called_once_with(device_id=None)
-
-    def test_toggle_playback_when_playing(
-        self, client: SpotifyClient, sample_playback_state: dict[str, Any]
-    ) -> None:
-        """Test toggle_playback pauses when playing."""
-        mock_sp = MagicMock()
-        mock_sp.current_playback.return_value = sample_playback_state
-        client._sp = mock_sp
-
-        client.toggle_playback()
-
-        mock_sp.pause_playback.assert_called_once()
-
-    def test_toggle_playback_when_paused(
-        self, client: SpotifyClient, sample_playback_state: dict[str, Any]
+    @pytest.mark.parametrize(
+        "playing,expected", [(True, "pause_playback"), (False, "start_playback")]
+    )
+    def test_toggle_playback(
+        self,
+        client: SpotifyClient,
+        shared_stub: _SpStub,
+        sample_playback_state: Mapping[str, Any],
+        playing: bool,
+        expected: str,
     ) -> None:
-        """Test toggle_playback plays when paused."""
-        sample_playback_state["is_playing"] = False
-        mock_sp = MagicMock()
-        mock_sp.current_playback.return_value = sample_playback_state
-        client._sp = mock_sp
+        """Test toggle_playback pauses when playing and plays when paused."""
+        shared_stub.set_return("current_playback", dict(sample_playback_state, is_playing=playing))
+        client._sp = shared_stub
 
         client.toggle_playback()
 
-        mock_sp.start_playback.assert_called_once()
-
-    def test_next_track(self, client: SpotifyClient) -> None:
-        """Test next_track method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.next_track()
-
-        assert result is True
-        mock_sp.next_track.assert_called_once()
-
-    def test_previous_track(self, client: SpotifyClient) -> None:
-        """Test previous_track method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.previous_track()
-
-        assert result is True
-        mock_sp.previous_track.assert_called_once()
-
-    def test_seek(self, client: SpotifyClient) -> None:
-        """Test seek method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.seek(60000)
-
-        assert result is True
-        mock_sp.seek_track.assert_called_once_with(60000, device_id=None)
-
-    def test_set_volume(self, client: SpotifyClient) -> None:
-        """Test set_volume method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.set_volume(75)
+        assert len(shared_stub.calls[expected]) == 1
 
-        assert result is True
-        mock_sp.volume.assert_called_once_with(75, device_id=None)
-
-    def test_set_volume_clamps_to_range(self, client: SpotifyClient) -> None:
+    def test_set_volume_clamps_to_range(self, client: SpotifyClient, shared_stub: _SpStub) -> None:
         """Test set_volume clamps values to 0-100."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
+        client._sp = shared_stub
 
         client.set_volume(150)
-        mock_sp.volume.assert_called_with(100, device_id=None)
+        assert shared_stub.calls["volume"][-1] == call(100, device_id=None)
 
         client.set_volume(-50)
-        mock_sp.volume.assert_called_with(0, device_id=None)
+        assert shared_stub.calls["volume"][-1] == call(0, device_id=None)
 
     def test_toggle_shuffle(
-        self, client: SpotifyClient, sample_playback_state: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_playback_state: Mapping[str, Any]
     ) -> None:
         """Test toggle_shuffle method."""
-        mock_sp = MagicMock()
-        mock_sp.current_playback.return_value = sample_playback_state
-        client._sp = mock_sp
+        shared_stub.set_return("current_playback", sample_playback_state)
+        client._sp = shared_stub
 
         result = client.toggle_shuffle()
 
         assert result is True
-        mock_sp.shuffle.assert_called_once_with(True, device_id=None)
+        assert shared_stub.calls["shuffle"] == [call(True, device_id=None)]
 
     def test_cycle_repeat(
-        self, client: SpotifyClient, sample_playback_state: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_playback_state: Mapping[str, Any]
     ) -> None:
         """Test cycle_repeat cycles through modes."""
-        mock_sp = MagicMock()
-        sample_playback_state["repeat_state"] = "off"
-        mock_sp.current_playback.return_value = sample_playback_state
-        client._sp = mock_sp
+        shared_stub.set_return("current_playback", dict(sample_playback_state, repeat_state="off"))
+        client._sp = shared_stub
 
         result = client.cycle_repeat()
 
         assert result == "context"
-        mock_sp.repeat.assert_called_once_with("context", device_id=None)
+        assert shared_stub.calls["repeat"] == [call("context", device_id=None)]
 
-    def test_play_uri_track(self, client: SpotifyClient) -> None:
+    def test_play_uri_track(self, client: SpotifyClient, shared_stub: _SpStub) -> None:
         """Test play_uri with a track URI."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
+        client._sp = shared_stub
 
         result = client.play_uri("spotify:track:abc123")
 
         assert result is True
-        mock_sp.start_playback.assert_called_once_with(
-            device_id=None, uris=["spotify:track:abc123"]
-        )
+        assert shared_stub.calls["start_playback"] == [
+            call(device_id=None, uris=["spotify:track:abc123"])
+        ]
 
-    def test_play_uri_context(self, client: SpotifyClient) -> None:
+    def test_play_uri_context(self, client: SpotifyClient, shared_stub: _SpStub) -> None:
         """Test play_uri with a context URI (playlist/album)."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
+        client._sp = shared_stub
 
         result = client.play_uri("spotify:playlist:abc123")
 
         assert result is True
-        mock_sp.start_playback.assert_called_once_with(
-            device_id=None, context_uri="spotify:playlist:abc123"
-        )
+        assert shared_stub.calls["start_playback"] == [
+            call(device_id=None, context_uri="spotify:playlist:abc123")
+        ]
 
     # ========================
     # Devices Tests
     # ========================
 
-    def test_get_devices(self, client: SpotifyClient, sample_devices: list[dict[str, Any]]) -> None:
+    def test_get_devices(
+        self,
+        client: SpotifyClient,
+        shared_stub: _SpStub,
+        sample_devices: tuple[Mapping[str, Any], ...],
+    ) -> None:
         """Test get_devices returns device list."""
-        mock_sp = MagicMock()
-        mock_sp.devices.return_value = {"devices": sample_devices}
-        client._sp = mock_sp
+        shared_stub.set_return("devices", {"devices": sample_devices})
+        client._sp = shared_stub
 
         devices = client.get_devices()
 
         assert len(devices) == 3
         assert devices[0]["name"] == "My Computer"
 
-    def test_transfer_playback(self, client: SpotifyClient) -> None:
-        """Test transfer_playback method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.transfer_playback("device123")
-
-        assert result is True
-        mock_sp.transfer_playback.assert_called_once_with("device123", force_play=False)
-
     # ========================
     # Library Tests
     # ========================
 
     def test_get_user_playlists(
-        self, client: SpotifyClient, sample_playlist: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_playlist: Mapping[str, Any]
     ) -> None:
         """Test get_user_playlists method."""
-        mock_sp = MagicMock()
-        mock_sp.current_user_playlists.return_value = {
-            "items": [sample_playlist],
-            "total": 1,
-        }
-        client._sp = mock_sp
+        shared_stub.set_return(
+            "current_user_playlists",
+            {
+                "items": [sample_playlist],
+                "total": 1,
+            },
+        )
+        client._sp = shared_stub
 
         result = client.get_user_playlists()
 
         assert result["total"] == 1
         assert len(result["items"]) == 1
-        mock_sp.current_user_playlists.assert_called_once_with(limit=50, offset=0)
+        assert shared_stub.calls["current_user_playlists"] == [call(limit=50, offset=0)]
 
     def test_get_playlist_tracks(
-        self, client: SpotifyClient, sample_track_item: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_track_item: Mapping[str, Any]
     ) -> None:
         """Test get_playlist_tracks method."""
-        mock_sp = MagicMock()
-        mock_sp.playlist_tracks.return_value = {
-            "items": [sample_track_item],
-            "total": 1,
-        }
-        client._sp = mock_sp
+        shared_stub.set_return(
+            "playlist_tracks",
+            {
+                "items": [sample_track_item],
+                "total": 1,
+            },
+        )
+        client._sp = shared_stub
 
         result = client.get_playlist_tracks("playlist123")
 
         assert result["total"] == 1
-        mock_sp.playlist_tracks.assert_called_once_with("playlist123", limit=100, offset=0)
+        assert shared_stub.calls["playlist_tracks"] == [call("playlist123", limit=100, offset=0)]
 
     def test_get_saved_tracks(
-        self, client: SpotifyClient, sample_track_item: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_track_item: Mapping[str, Any]
     ) -> None:
         """Test get_saved_tracks method."""
-        mock_sp = MagicMock()
-        mock_sp.current_user_saved_tracks.return_value = {
-            "items": [sample_track_item],
-            "total": 1,
-        }
-        client._sp = mock_sp
+        shared_stub.set_return(
+            "current_user_saved_tracks",
+            {
+                "items": [sample_track_item],
+                "total": 1,
+            },
+        )
+        client._sp = shared_stub
 
         result = client.get_saved_tracks()
 
         assert result["total"] == 1
-        mock_sp.current_user_saved_tracks.assert_called_once()
-
-    def test_save_track(self, client: SpotifyClient) -> None:
-        """Test save_track method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.save_track("track123")
+        assert len(shared_stub.calls["current_user_saved_tracks"]) == 1
 
-        assert result is True
-        mock_sp.current_user_saved_tracks_add.assert_called_once_with(["track123"])
-
-    def test_remove_saved_track(self, client: SpotifyClient) -> None:
-        """Test remove_saved_track method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.remove_saved_track("track123")
-
-        assert result is True
-        mock_sp.current_user_saved_tracks_delete.assert_called_once_with(["track123"])
-
-    def test_is_track_saved(self, client: SpotifyClient) -> None:
+    def test_is_track_saved(self, client: SpotifyClient, shared_stub: _SpStub) -> None:
         """Test is_track_saved method."""
-        mock_sp = MagicMock()
-        mock_sp.current_user_saved_tracks_contains.return_value = [True]
-        client._sp = mock_sp
+        shared_stub.set_return("current_user_saved_tracks_contains", [True])
+        client._sp = shared_stub
 
         result = client.is_track_saved("track123")
 
@@ -416,133 +543,92 @@ class TestSpotifyClient:
     # Albums & Artists Tests
     # ========================
 
-    def test_get_album(self, client: SpotifyClient, sample_album: dict[str, Any]) -> None:
-        """Test get_album method."""
-        mock_sp = MagicMock()
-        mock_sp.album.return_value = sample_album
-        client._sp = mock_sp
-
-        result = client.get_album("album123")
-
-        assert result == sample_album
-        mock_sp.album.assert_called_once_with("album123")
-
-    def test_get_artist(self, client: SpotifyClient, sample_artist: dict[str, Any]) -> None:
-        """Test get_artist method."""
-        mock_sp = MagicMock()
-        mock_sp.artist.return_value = sample_artist
-        client._sp = mock_sp
-
-        result = client.get_artist("artist1")
-
-        assert result == sample_artist
-        mock_sp.artist.assert_called_once_with("artist1")
-
     def test_get_artist_top_tracks(
-        self, client: SpotifyClient, sample_track: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_track: Mapping[str, Any]
     ) -> None:
         """Test get_artist_top_tracks method."""
-        mock_sp = MagicMock()
-        mock_sp.artist_top_tracks.return_value = {"tracks": [sample_track]}
-        client._sp = mock_sp
+        shared_stub.set_return("artist_top_tracks", {"tracks": [sample_track]})
+        client._sp = shared_stub
 
         result = client.get_artist_top_tracks("artist1")
 
         assert len(result) == 1
-        mock_sp.artist_top_tracks.assert_called_once_with("artist1", country="US")
+        assert shared_stub.calls["artist_top_tracks"] == [call("artist1", country="US")]
 
     # ========================
     # Search Tests
     # ========================
 
-    def test_search(self, client: SpotifyClient, sample_search_results: dict[str, Any]) -> None:
+    def test_search(
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_search_results: Mapping[str, Any]
+    ) -> None:
         """Test search method."""
-        mock_sp = MagicMock()
-        mock_sp.search.return_value = sample_search_results
-        client._sp = mock_sp
+        shared_stub.set_return("search", sample_search_results)
+        client._sp = shared_stub
 
         result = client.search("test query")
 
         assert "tracks" in result
         assert "albums" in result
-        mock_sp.search.assert_called_once_with(
-            q="test query",
-            type="track,album,artist,playlist",
-            limit=20,
-            offset=0,
-        )
-
-    def test_search_specific_types(self, client: SpotifyClient) -> None:
+        assert shared_stub.calls["search"] == [
+            call(
+                q="test query",
+                type="track,album,artist,playlist",
+                limit=20,
+                offset=0,
+            )
+        ]
+
+    def test_search_specific_types(self, client: SpotifyClient, shared_stub: _SpStub) -> None:
         """Test search with specific types."""
-        mock_sp = MagicMock()
-        mock_sp.search.return_value = {}
-        client._sp = mock_sp
+        shared_stub.set_return("search", {})
+        client._sp = shared_stub
 
         client.search("test", types=["track", "album"])
 
-        mock_sp.search.assert_called_once_with(
-            q="test",
-            type="track,album",
-            limit=20,
-            offset=0,
-        )
+        assert shared_stub.calls["search"] == [
+            call(
+                q="test",
+                type="track,album",
+                limit=20,
+                offset=0,
+            )
+        ]
 
     # ========================
     # Queue Tests
     # ========================
 
-    def test_add_to_queue(self, client: SpotifyClient) -> None:
-        """Test add_to_queue method."""
-        mock_sp = MagicMock()
-        client._sp = mock_sp
-
-        result = client.add_to_queue("spotify:track:abc123")
-
-        assert result is True
-        mock_sp.add_to_queue.assert_called_once_with("spotify:track:abc123", device_id=None)
-
-    def test_get_queue(self, client: SpotifyClient, sample_track: dict[str, Any]) -> None:
+    def test_get_queue(
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_track: Mapping[str, Any]
+    ) -> None:
         """Test get_queue method."""
-        mock_sp = MagicMock()
-        mock_sp.queue.return_value = {
-            "currently_playing": sample_track,
-            "queue": [sample_track],
-        }
-        client._sp = mock_sp
+        shared_stub.set_return(
+            "queue",
+            {
+                "currently_playing": sample_track,
+                "queue": [sample_track],
+            },
+        )
+        client._sp = shared_stub
 
         result = client.get_queue()
 
         assert result["currently_playing"] == sample_track
         assert len(result["queue"]) == 1
 
-    # ========================
-    # User Profile Tests
-    # ========================
-
-    def test_get_current_user(self, client: SpotifyClient, sample_user: dict[str, Any]) -> None:
-        """Test get_current_user method."""
-        mock_sp = MagicMock()
-        mock_sp.current_user.return_value = sample_user
-        client._sp = mock_sp
-
-        result = client.get_current_user()
-
-        assert result == sample_user
-        assert result["display_name"] == "Test User"
-
     # ========================
     # Recently Played Tests
     # ========================
 
     def test_get_recently_played(
-        self, client: SpotifyClient, sample_recently_played: dict[str, Any]
+        self, client: SpotifyClient, shared_stub: _SpStub, sample_recently_played: Mapping[str, Any]
     ) -> None:
         """Test get_recently_played method."""
-        mock_sp = MagicMock()
-        mock_sp.current_user_recently_played.return_value = sample_recently_played
-        client._sp = mock_sp
+        shared_stub.set_return("current_user_recently_played", sample_recently_played)
+        client._sp = shared_stub
 
         result = client.get_recently_played()
 
         assert len(result["items"]) == 1
-        mock_sp.current_user_recently_played.assert_called_once_with(limit=50)
+        assert shared_stub.calls["current_user_recently_played"] == [call(limit=50)]
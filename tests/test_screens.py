@@ -1,331 +1,244 @@
 """Tests for Textual screens."""
 
-import pytest
-from typing import Any
-from unittest.mock import MagicMock, patch, AsyncMock
+import asyncio
+from collections.abc import AsyncGenerator
+from functools import partial
 
-from textual.app import App, ComposeResult
+import pytest
+import pytest_asyncio
+from textual.app import App
+from textual.pilot import Pilot
+
+from spotuify.screens.album import AlbumScreen
+from spotuify.screens.artist import ArtistScreen
+from spotuify.screens.devices import DevicesScreen
+from spotuify.screens.help import HelpScreen
+from spotuify.screens.library import LibraryScreen
+from spotuify.screens.main import MainScreen
+from spotuify.screens.playlist import PlaylistScreen
+from spotuify.screens.search import SearchScreen
+
+# Navigation tests drive the session-wide textual_app, so they must share its loop
+_on_session_loop = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _wait_until_screen(app: App, cls: type, timeout: float = 1.0) -> None:
+    """Yield to the event loop until the active screen is an instance of cls."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not isinstance(app.screen, cls):
+        if loop.time() > deadline:
+            raise AssertionError(f"Screen {cls.__name__} not reached")
+        await asyncio.sleep(0)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def nav_pilot(textual_app: Pilot) -> AsyncGenerator[Pilot, None]:
+    """Hand out the shared test app and restore its screen stack afterwards."""
+    depth = len(textual_app.app.screen_stack)
+    yield textual_app
+    while len(textual_app.app.screen_stack) > depth:
+        await textual_app.app.pop_screen()
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def screen_pilot(
+    request: pytest.FixtureRequest, textual_app: Pilot
+) -> AsyncGenerator[Pilot, None]:
+    """Show the requesting class's SCREEN on the shared test app for the whole class."""
+    await textual_app.app.push_screen(request.cls.SCREEN())
+    yield textual_app
+    await textual_app.app.pop_screen()
 
 
 class TestMainScreen:
     """Tests for MainScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with MainScreen."""
-        from spotuify.screens.main import MainScreen
-
-        class TestApp(App):
-            SCREENS = {"main": MainScreen}
-
-            def on_mount(self) -> None:
-                self.push_screen("main")
-
-        return TestApp
+    SCREEN = MainScreen
 
-    @pytest.mark.asyncio
-    async def test_main_screen_renders(self, screen_app: type[App]) -> None:
+    def test_main_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test MainScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            # Check key components exist
-            assert app.query_one("#sidebar") is not None
-            assert app.query_one("#now-playing") is not None
-            assert app.query_one("#player-controls") is not None
-
-    @pytest.mark.asyncio
-    async def test_main_screen_has_content_area(self, screen_app: type[App]) -> None:
+        app = screen_pilot.app
+        # Check key components exist
+        assert app.screen.get_widget_by_id("sidebar") is not None
+        assert app.screen.get_widget_by_id("now-playing") is not None
+        assert app.screen.get_widget_by_id("player-controls") is not None
+
+    def test_main_screen_has_content_area(self, screen_pilot: Pilot) -> None:
         """Test MainScreen has content area."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            assert app.query_one("#main-track-list") is not None
+        app = screen_pilot.app
+        assert app.screen.get_widget_by_id("main-track-list") is not None
 
-    @pytest.mark.asyncio
-    async def test_main_screen_default_title(self, screen_app: type[App]) -> None:
+    def test_main_screen_default_title(self, screen_pilot: Pilot) -> None:
         """Test MainScreen default content title."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            screen = app.screen
-            assert screen.content_title == "Home"
+        app = screen_pilot.app
+        screen = app.screen
+        assert screen.content_title == "Home"
 
 
 class TestSearchScreen:
     """Tests for SearchScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with SearchScreen."""
-        from spotuify.screens.search import SearchScreen
-
-        class TestApp(App):
-            SCREENS = {"search": SearchScreen}
-
-            def on_mount(self) -> None:
-                self.push_screen("search")
-
-        return TestApp
+    SCREEN = SearchScreen
 
-    @pytest.mark.asyncio
-    async def test_search_screen_renders(self, screen_app: type[App]) -> None:
+    def test_search_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test SearchScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            # Check search bar exists
-            assert app.query_one("#search-bar") is not None
+        app = screen_pilot.app
+        # Check search bar exists
+        assert app.screen.get_widget_by_id("search-bar") is not None
 
-    @pytest.mark.asyncio
-    async def test_search_screen_has_result_tabs(self, screen_app: type[App]) -> None:
+    def test_search_screen_has_result_tabs(self, screen_pilot: Pilot) -> None:
         """Test SearchScreen has result tabs."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            assert app.query_one("#tracks-tab") is not None
-            assert app.query_one("#albums-tab") is not None
-            assert app.query_one("#artists-tab") is not None
-            assert app.query_one("#playlists-tab") is not None
-
-    @pytest.mark.asyncio
-    async def test_search_screen_escape_goes_back(self, screen_app: type[App]) -> None:
-        """Test pressing escape pops the screen."""
-        from spotuify.screens.search import SearchScreen
-        from spotuify.screens.main import MainScreen
+        app = screen_pilot.app
+        assert app.screen.get_widget_by_id("tracks-tab") is not None
+        assert app.screen.get_widget_by_id("albums-tab") is not None
+        assert app.screen.get_widget_by_id("artists-tab") is not None
+        assert app.screen.get_widget_by_id("playlists-tab") is not None
 
-        class TestApp(App):
-            SCREENS = {"main": MainScreen, "search": SearchScreen}
 
-            def on_mount(self) -> None:
-                self.push_screen("main")
-                self.push_screen("search")
+class TestSearchScreenNavigation:
+    """Tests for leaving SearchScreen; each restores the shared screen stack."""
 
-        async with TestApp().run_test() as pilot:
-            app = pilot.app
-            # Should be on search screen
-            assert isinstance(app.screen, SearchScreen)
+    @_on_session_loop
+    async def test_search_screen_escape_goes_back(self, nav_pilot: Pilot) -> None:
+        """Test pressing escape pops the screen."""
+        app = nav_pilot.app
+        await app.push_screen("main")
+        await app.push_screen("search")
+        # Should be on search screen
+        assert type(app.screen) is SearchScreen
 
-            await pilot.press("escape")
-            await pilot.pause()
+        await nav_pilot.press("escape")
+        await _wait_until_screen(app, MainScreen)
 
-            # Should be back on main screen
-            assert isinstance(app.screen, MainScreen)
+        # Should be back on main screen
+        assert type(app.screen) is MainScreen
 
 
 class TestPlaylistScreen:
     """Tests for PlaylistScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with PlaylistScreen."""
-        from spotuify.screens.playlist import PlaylistScreen
-
-        class TestApp(App):
-            def on_mount(self) -> None:
-                self.push_screen(PlaylistScreen(playlist_id="test123"))
-
-        return TestApp
+    SCREEN = partial(PlaylistScreen, playlist_id="test123")
 
-    @pytest.mark.asyncio
-    async def test_playlist_screen_renders(self, screen_app: type[App]) -> None:
+    def test_playlist_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test PlaylistScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            assert app.query_one("#playlist-title") is not None
-            assert app.query_one("#playlist-tracks") is not None
+        app = screen_pilot.app
+        assert app.screen.get_widget_by_id("playlist-title") is not None
+        assert app.screen.get_widget_by_id("playlist-tracks") is not None
 
-    @pytest.mark.asyncio
-    async def test_playlist_screen_stores_id(self, screen_app: type[App]) -> None:
+    def test_playlist_screen_stores_id(self, screen_pilot: Pilot) -> None:
         """Test PlaylistScreen stores playlist_id."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            screen = app.screen
-            assert screen.playlist_id == "test123"
+        app = screen_pilot.app
+        screen = app.screen
+        assert screen.playlist_id == "test123"
 
 
 class TestAlbumScreen:
     """Tests for AlbumScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with AlbumScreen."""
-        from spotuify.screens.album import AlbumScreen
+    SCREEN = partial(AlbumScreen, album_id="album123")
 
-        class TestApp(App):
-            def on_mount(self) -> None:
-                self.push_screen(AlbumScreen(album_id="album123"))
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_album_screen_renders(self, screen_app: type[App]) -> None:
+    def test_album_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test AlbumScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            assert app.query_one("#album-title") is not None
-            assert app.query_one("#album-tracks") is not None
+        app = screen_pilot.app
+        assert app.screen.get_widget_by_id("album-title") is not None
+        assert app.screen.get_widget_by_id("album-tracks") is not None
 
-    @pytest.mark.asyncio
-    async def test_album_screen_stores_id(self, screen_app: type[App]) -> None:
+    def test_album_screen_stores_id(self, screen_pilot: Pilot) -> None:
         """Test AlbumScreen stores album_id."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            screen = app.screen
-            assert screen.album_id == "album123"
+        app = screen_pilot.app
+        screen = app.screen
+        assert screen.album_id == "album123"
 
 
 class TestArtistScreen:
     """Tests for ArtistScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with ArtistScreen."""
-        from spotuify.screens.artist import ArtistScreen
-
-        class TestApp(App):
-            def on_mount(self) -> None:
-                self.push_screen(ArtistScreen(artist_id="artist1"))
-
-        return TestApp
+    SCREEN = partial(ArtistScreen, artist_id="artist1")
 
-    @pytest.mark.asyncio
-    async def test_artist_screen_renders(self, screen_app: type[App]) -> None:
+    def test_artist_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test ArtistScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            assert app.query_one("#artist-name") is not None
-            assert app.query_one("#artist-top-tracks") is not None
-            assert app.query_one("#artist-albums") is not None
-
-    @pytest.mark.asyncio
-    async def test_artist_screen_stores_id(self, screen_app: type[App]) -> None:
+        app = screen_pilot.app
+        assert app.screen.get_widget_by_id("artist-name") is not None
+        assert app.screen.get_widget_by_id("artist-top-tracks") is not None
+        assert app.screen.get_widget_by_id("artist-albums") is not None
+
+    def test_artist_screen_stores_id(self, screen_pilot: Pilot) -> None:
         """Test ArtistScreen stores artist_id."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            screen = app.screen
-            assert screen.artist_id == "artist1"
+        app = screen_pilot.app
+        screen = app.screen
+        assert screen.artist_id == "artist1"
 
 
 class TestLibraryScreen:
     """Tests for LibraryScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with LibraryScreen."""
-        from spotuify.screens.library import LibraryScreen
-
-        class TestApp(App):
-            SCREENS = {"library": LibraryScreen}
-
-            def on_mount(self) -> None:
-                self.push_screen("library")
-
-        return TestApp
+    SCREEN = LibraryScreen
 
-    @pytest.mark.asyncio
-    async def test_library_screen_renders(self, screen_app: type[App]) -> None:
+    def test_library_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test LibraryScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            # Check tabs exist
-            assert app.query_one("#liked-tab") is not None
-            assert app.query_one("#albums-tab") is not None
-            assert app.query_one("#artists-tab") is not None
-
-    @pytest.mark.asyncio
-    async def test_library_screen_has_track_list(self, screen_app: type[App]) -> None:
+        app = screen_pilot.app
+        # Check tabs exist
+        assert app.screen.get_widget_by_id("liked-tab") is not None
+        assert app.screen.get_widget_by_id("albums-tab") is not None
+        assert app.screen.get_widget_by_id("artists-tab") is not None
+
+    def test_library_screen_has_track_list(self, screen_pilot: Pilot) -> None:
         """Test LibraryScreen has liked tracks list."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            assert app.query_one("#liked-tracks") is not None
+        app = screen_pilot.app
+        assert app.screen.get_widget_by_id("liked-tracks") is not None
 
 
 class TestDevicesScreen:
     """Tests for DevicesScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with DevicesScreen."""
-        from spotuify.screens.devices import DevicesScreen
-
-        class TestApp(App):
-            SCREENS = {"devices": DevicesScreen}
-
-            def on_mount(self) -> None:
-                self.push_screen("devices")
-
-        return TestApp
+    SCREEN = DevicesScreen
 
-    @pytest.mark.asyncio
-    async def test_devices_screen_renders(self, screen_app: type[App]) -> None:
+    def test_devices_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test DevicesScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            assert app.query_one("#device-selector") is not None
+        app = screen_pilot.app
+        assert app.screen.get_widget_by_id("device-selector") is not None
 
 
 class TestHelpScreen:
     """Tests for HelpScreen."""
 
-    @pytest.fixture
-    def screen_app(self) -> type[App]:
-        """Create a test app with HelpScreen."""
-        from spotuify.screens.help import HelpScreen
+    SCREEN = HelpScreen
 
-        class TestApp(App):
-            SCREENS = {"help": HelpScreen}
-
-            def on_mount(self) -> None:
-                self.push_screen("help")
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_help_screen_renders(self, screen_app: type[App]) -> None:
+    def test_help_screen_renders(self, screen_pilot: Pilot) -> None:
         """Test HelpScreen renders without errors."""
-        async with screen_app().run_test() as pilot:
-            app = pilot.app
-            # Check shortcut tables exist
-            assert app.query_one("#playback-shortcuts") is not None
-            assert app.query_one("#navigation-shortcuts") is not None
-            assert app.query_one("#volume-shortcuts") is not None
-
-    @pytest.mark.asyncio
-    async def test_help_screen_escape_closes(self, screen_app: type[App]) -> None:
-        """Test pressing escape closes help screen."""
-        from spotuify.screens.help import HelpScreen
-        from spotuify.screens.main import MainScreen
+        app = screen_pilot.app
+        # Check shortcut tables exist
+        assert app.screen.get_widget_by_id("playback-shortcuts") is not None
+        assert app.screen.get_widget_by_id("navigation-shortcuts") is not None
+        assert app.screen.get_widget_by_id("volume-shortcuts") is not None
 
-        class TestApp(App):
-            SCREENS = {"main": MainScreen, "help": HelpScreen}
 
-            def on_mount(self) -> None:
-                self.push_screen("main")
-                self.push_screen("help")
+class TestHelpScreenNavigation:
+    """Tests for closing HelpScreen; each restores the shared screen stack."""
 
-        async with TestApp().run_test() as pilot:
-            app = pilot.app
-            assert isinstance(app.screen, HelpScreen)
+    @_on_session_loop
+    async def test_help_screen_escape_closes(self, nav_pilot: Pilot) -> None:
+        """Test pressing escape closes help screen."""
+        app = nav_pilot.app
+        await app.push_screen("main")
+        await app.push_screen("help")
+        assert type(app.screen) is HelpScreen
 
-            await pilot.press("escape")
-            await pilot.pause()
+        await nav_pilot.press("escape")
+        await _wait_until_screen(app, MainScreen)
 
-            assert isinstance(app.screen, MainScreen)
+        assert type(app.screen) is MainScreen
 
-    @pytest.mark.asyncio
-    async def test_help_screen_q_closes(self, screen_app: type[App]) -> None:
+    @_on_session_loop
+    async def test_help_screen_q_closes(self, nav_pilot: Pilot) -> None:
         """Test pressing q closes help screen."""
-        from spotuify.screens.help import HelpScreen
-        from spotuify.screens.main import MainScreen
-
-        class TestApp(App):
-            SCREENS = {"main": MainScreen, "help": HelpScreen}
-
-            def on_mount(self) -> None:
-                self.push_screen("main")
-                self.push_screen("help")
-
-        async with TestApp().run_test() as pilot:
-            app = pilot.app
-            assert isinstance(app.screen, HelpScreen)
+        app = nav_pilot.app
+        await app.push_screen("main")
+        await app.push_screen("help")
+        assert type(app.screen) is HelpScreen
 
-            await pilot.press("q")
-            await pilot.pause()
+        await nav_pilot.press("q")
+        await _wait_until_screen(app, MainScreen)
 
-            assert isinstance(app.screen, MainScreen)
+        assert type(app.screen) is MainScreen
@@ -1,46 +1,60 @@
 """Tests for Textual widgets."""
 
-import pytest
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
 from typing import Any
-from unittest.mock import MagicMock, patch, AsyncMock
 
+import pytest
+import pytest_asyncio
 from textual.app import App, ComposeResult
+from textual.message import Message
 from textual.pilot import Pilot
 
+from spotuify.widgets.device_selector import DeviceSelector
+from spotuify.widgets.now_playing import NowPlaying
+from spotuify.widgets.player_controls import PlayerControls
+from spotuify.widgets.progress_bar import PlaybackProgress
+from spotuify.widgets.search_bar import SearchBar
+from spotuify.widgets.sidebar import Sidebar
+from spotuify.widgets.track_list import TrackList
+from spotuify.widgets.volume_bar import VolumeBar
 
-class TestNowPlayingWidget:
-    """Tests for NowPlaying widget."""
 
-    @pytest.fixture
-    def widget_app(self) -> type[App]:
-        """Create a test app with NowPlaying widget."""
-        from spotuify.widgets.now_playing import NowPlaying
+class _ControlsMessageApp(App):
+    """Test app that records the playback messages PlayerControls posts."""
 
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield NowPlaying(id="now-playing")
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[Message] = []
+
+    def compose(self) -> ComposeResult:
+        yield PlayerControls(id="controls")
 
-        return TestApp
+    def on_player_controls_play_pause(self, event: PlayerControls.PlayPause) -> None:
+        self.messages.append(event)
 
-    @pytest.mark.asyncio
-    async def test_now_playing_default_state(self, widget_app: type[App]) -> None:
+    def on_player_controls_next(self, event: PlayerControls.Next) -> None:
+        self.messages.append(event)
+
+    def on_player_controls_previous(self, event: PlayerControls.Previous) -> None:
+        self.messages.append(event)
+
+
+class TestNowPlayingWidget:
+    """Tests for NowPlaying widget."""
+
+    async def test_now_playing_default_state(self, make_widget: Callable[..., Any]) -> None:
         """Test NowPlaying widget default state."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#now-playing")
+        async with make_widget(NowPlaying, "now-playing") as widget:
             assert widget.track_name == "No track playing"
             assert widget.artist_name == ""
             assert widget.is_playing is False
 
-    @pytest.mark.asyncio
     async def test_now_playing_update_track(
-        self, widget_app: type[App], sample_track: dict[str, Any]
+        self, make_widget: Callable[..., Any], sample_track: Mapping[str, Any]
     ) -> None:
         """Test updating track information."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#now-playing")
-
+        async with make_widget(NowPlaying, "now-playing") as widget:
             widget.update_track(track=sample_track, is_playing=True, progress_ms=45000)
 
             assert widget.track_name == "Test Track"
@@ -48,15 +62,11 @@ class TestNowPlayingWidget:
             assert widget.is_playing is True
             assert widget.progress_ms == 45000
 
-    @pytest.mark.asyncio
     async def test_now_playing_clear_track(
-        self, widget_app: type[App], sample_track: dict[str, Any]
+        self, make_widget: Callable[..., Any], sample_track: Mapping[str, Any]
     ) -> None:
         """Test clearing track information."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#now-playing")
-
+        async with make_widget(NowPlaying, "now-playing") as widget:
             # Set a track first
             widget.update_track(track=sample_track, is_playing=True)
             # Clear it
@@ -69,213 +79,121 @@ class TestNowPlayingWidget:
 class TestPlayerControlsWidget:
     """Tests for PlayerControls widget."""
 
-    @pytest.fixture
-    def widget_app(self) -> type[App]:
-        """Create a test app with PlayerControls widget."""
-        from spotuify.widgets.player_controls import PlayerControls
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield PlayerControls(id="controls")
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_player_controls_default_state(self, widget_app: type[App]) -> None:
+    async def test_player_controls_default_state(self, make_widget: Callable[..., Any]) -> None:
         """Test PlayerControls default state."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#controls")
+        async with make_widget(PlayerControls, "controls") as widget:
             assert widget.is_playing is False
             assert widget.shuffle_state is False
             assert widget.repeat_state == "off"
 
-    @pytest.mark.asyncio
-    async def test_player_controls_update_state(self, widget_app: type[App]) -> None:
+    async def test_player_controls_update_state(self, make_widget: Callable[..., Any]) -> None:
         """Test updating player control states."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#controls")
-
+        async with make_widget(PlayerControls, "controls") as widget:
             widget.update_state(is_playing=True, shuffle_state=True, repeat_state="track")
 
             assert widget.is_playing is True
             assert widget.shuffle_state is True
             assert widget.repeat_state == "track"
 
-    @pytest.mark.asyncio
-    async def test_player_controls_play_button_message(self, widget_app: type[App]) -> None:
-        """Test that pressing play button emits PlayPause message."""
-        from spotuify.widgets.player_controls import PlayerControls
-
-        messages = []
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield PlayerControls(id="controls")
-
-            def on_player_controls_play_pause(self, event: PlayerControls.PlayPause) -> None:
-                messages.append(event)
-
-        async with TestApp().run_test() as pilot:
-            await pilot.click("#play-btn")
-            assert len(messages) == 1
-
-    @pytest.mark.asyncio
-    async def test_player_controls_next_button_message(self, widget_app: type[App]) -> None:
-        """Test that pressing next button emits Next message."""
-        from spotuify.widgets.player_controls import PlayerControls
-
-        messages = []
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield PlayerControls(id="controls")
-
-            def on_player_controls_next(self, event: PlayerControls.Next) -> None:
-                messages.append(event)
-
-        async with TestApp().run_test() as pilot:
-            await pilot.click("#next-btn")
-            assert len(messages) == 1
-
-    @pytest.mark.asyncio
-    async def test_player_controls_previous_button_message(self, widget_app: type[App]) -> None:
-        """Test that pressing previous button emits Previous message."""
-        from spotuify.widgets.player_controls import PlayerControls
-
-        messages = []
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield PlayerControls(id="controls")
+    @pytest_asyncio.fixture(scope="class", loop_scope="class")
+    async def controls_pilot(self) -> AsyncGenerator[Pilot, None]:
+        """Run one message-recording PlayerControls app for the whole class."""
+        async with _ControlsMessageApp().run_test() as pilot:
+            yield pilot
+
+    @pytest.mark.parametrize(
+        "button_id,message_cls",
+        [
+            ("#play-btn", PlayerControls.PlayPause),
+            ("#next-btn", PlayerControls.Next),
+            ("#prev-btn", PlayerControls.Previous),
+        ],
+        ids=["play", "next", "previous"],
+    )
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_player_controls_button_message(
+        self, controls_pilot: Pilot, button_id: str, message_cls: type[Message]
+    ) -> None:
+        """Test that pressing each control button emits its message."""
+        messages = controls_pilot.app.messages
+        messages.clear()
 
-            def on_player_controls_previous(self, event: PlayerControls.Previous) -> None:
-                messages.append(event)
+        await controls_pilot.click(button_id)
 
-        async with TestApp().run_test() as pilot:
-            await pilot.click("#prev-btn")
-            assert len(messages) == 1
+        assert [type(m) for m in messages] == [message_cls]
 
 
 class TestVolumeBarWidget:
     """Tests for VolumeBar widget."""
 
     @pytest.fixture
-    def widget_app(self) -> type[App]:
-        """Create a test app with VolumeBar widget."""
-        from spotuify.widgets.volume_bar import VolumeBar
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield VolumeBar(id="volume")
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_volume_bar_default_state(self, widget_app: type[App]) -> None:
+    def volume_bar(self, volume_pilot: Pilot) -> Generator[VolumeBar, None, None]:
+        """Hand out the shared VolumeBar and restore its default state afterwards."""
+        widget = volume_pilot.app.query_one("#volume")
+        yield widget
+        widget.set_volume(50)
+        widget.is_muted = False
+        widget._pre_mute_volume = VolumeBar._pre_mute_volume
+
+    async def test_volume_bar_default_state(self, make_widget: Callable[..., Any]) -> None:
         """Test VolumeBar default state."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#volume")
+        # A fresh app, so the shared widget's teardown can't mask a wrong default
+        async with make_widget(VolumeBar, "volume") as widget:
             assert widget.volume == 50
             assert widget.is_muted is False
 
-    @pytest.mark.asyncio
-    async def test_volume_bar_set_volume(self, widget_app: type[App]) -> None:
+    def test_volume_bar_set_volume(self, volume_bar: VolumeBar) -> None:
         """Test setting volume."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#volume")
+        volume_bar.set_volume(75)
 
-            widget.set_volume(75)
+        assert volume_bar.volume == 75
 
-            assert widget.volume == 75
-
-    @pytest.mark.asyncio
-    async def test_volume_bar_clamps_volume(self, widget_app: type[App]) -> None:
+    def test_volume_bar_clamps_volume(self, volume_bar: VolumeBar) -> None:
         """Test that volume is clamped to 0-100."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#volume")
-
-            widget.set_volume(150)
-            assert widget.volume == 100
+        volume_bar.set_volume(150)
+        assert volume_bar.volume == 100
 
-            widget.set_volume(-50)
-            assert widget.volume == 0
+        volume_bar.set_volume(-50)
+        assert volume_bar.volume == 0
 
-    @pytest.mark.asyncio
-    async def test_volume_bar_increase(self, widget_app: type[App]) -> None:
+    def test_volume_bar_increase(self, volume_bar: VolumeBar) -> None:
         """Test increasing volume."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#volume")
-
-            widget.set_volume(50)
-            widget.increase_volume(10)
+        volume_bar.set_volume(50)
+        volume_bar.increase_volume(10)
 
-            assert widget.volume == 60
+        assert volume_bar.volume == 60
 
-    @pytest.mark.asyncio
-    async def test_volume_bar_decrease(self, widget_app: type[App]) -> None:
+    def test_volume_bar_decrease(self, volume_bar: VolumeBar) -> None:
         """Test decreasing volume."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#volume")
-
-            widget.set_volume(50)
-            widget.decrease_volume(10)
+        volume_bar.set_volume(50)
+        volume_bar.decrease_volume(10)
 
-            assert widget.volume == 40
+        assert volume_bar.volume == 40
 
-    @pytest.mark.asyncio
-    async def test_volume_bar_toggle_mute(self, widget_app: type[App]) -> None:
+    def test_volume_bar_toggle_mute(self, volume_bar: VolumeBar) -> None:
         """Test toggling mute."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#volume")
-
-            widget.set_volume(75)
-            assert widget.is_muted is False
+        volume_bar.set_volume(75)
+        assert volume_bar.is_muted is False
 
-            widget.toggle_mute()
-            assert widget.is_muted is True
+        volume_bar.toggle_mute()
+        assert volume_bar.is_muted is True
 
-            widget.toggle_mute()
-            assert widget.is_muted is False
+        volume_bar.toggle_mute()
+        assert volume_bar.is_muted is False
 
 
 class TestPlaybackProgressWidget:
     """Tests for PlaybackProgress widget."""
 
-    @pytest.fixture
-    def widget_app(self) -> type[App]:
-        """Create a test app with PlaybackProgress widget."""
-        from spotuify.widgets.progress_bar import PlaybackProgress
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield PlaybackProgress(id="progress")
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_progress_bar_default_state(self, widget_app: type[App]) -> None:
+    async def test_progress_bar_default_state(self, make_widget: Callable[..., Any]) -> None:
         """Test PlaybackProgress default state."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#progress")
+        async with make_widget(PlaybackProgress, "progress") as widget:
             assert widget.progress_ms == 0
             assert widget.duration_ms == 0
 
-    @pytest.mark.asyncio
-    async def test_progress_bar_update(self, widget_app: type[App]) -> None:
+    async def test_progress_bar_update(self, make_widget: Callable[..., Any]) -> None:
         """Test updating progress."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#progress")
-
+        async with make_widget(PlaybackProgress, "progress") as widget:
             widget.update_progress(60000, 180000)  # 1:00 / 3:00
 
             assert widget.progress_ms == 60000
@@ -286,21 +204,12 @@ class TestSearchBarWidget:
     """Tests for SearchBar widget."""
 
     @pytest.fixture
-    def widget_app(self) -> type[App]:
+    def widget_app(self, widget_app_factory: Callable[..., type[App]]) -> type[App]:
         """Create a test app with SearchBar widget."""
-        from spotuify.widgets.search_bar import SearchBar
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield SearchBar(id="search")
-
-        return TestApp
+        return widget_app_factory(SearchBar, "search")
 
-    @pytest.mark.asyncio
     async def test_search_bar_submit_message(self, widget_app: type[App]) -> None:
         """Test that submitting search emits SearchSubmitted message."""
-        from spotuify.widgets.search_bar import SearchBar
-
         messages = []
 
         class TestApp(App):
@@ -317,28 +226,24 @@ class TestSearchBarWidget:
             await pilot.press("enter")
 
             # Wait for message processing
-            await pilot.pause()
+            await asyncio.sleep(0)
             assert "test query" in messages
 
-    @pytest.mark.asyncio
     async def test_search_bar_get_query(self, widget_app: type[App]) -> None:
         """Test getting current query."""
         async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#search")
-            search_input = app.query_one("#search-input")
+            widget = pilot.app.query_one("#search")
+            search_input = widget.query_one("#search-input")
 
             search_input.value = "my search"
 
             assert widget.get_query() == "my search"
 
-    @pytest.mark.asyncio
     async def test_search_bar_clear(self, widget_app: type[App]) -> None:
         """Test clearing search."""
         async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#search")
-            search_input = app.query_one("#search-input")
+            widget = pilot.app.query_one("#search")
+            search_input = widget.query_one("#search-input")
 
             search_input.value = "my search"
             widget.clear_search()
@@ -349,47 +254,27 @@ class TestSearchBarWidget:
 class TestSidebarWidget:
     """Tests for Sidebar widget."""
 
-    @pytest.fixture
-    def widget_app(self) -> type[App]:
-        """Create a test app with Sidebar widget."""
-        from spotuify.widgets.sidebar import Sidebar
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield Sidebar(id="sidebar")
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_sidebar_default_nav_items(self, widget_app: type[App]) -> None:
-        """Test Sidebar has default navigation items."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#sidebar")
-
-            # Check that nav list exists
-            nav_list = app.query_one("#nav-list")
-            assert nav_list is not None
-
-    @pytest.mark.asyncio
-    async def test_sidebar_set_playlists(
-        self, widget_app: type[App], sample_playlist: dict[str, Any]
+    async def test_sidebar_state(
+        self,
+        make_widget: Callable[..., Any],
+        subtests: pytest.Subtests,
+        sample_playlist: Mapping[str, Any],
     ) -> None:
-        """Test setting playlists in sidebar."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#sidebar")
+        """Test Sidebar default navigation items and set_playlists on one app."""
+        async with make_widget(Sidebar, "sidebar") as widget:
+            with subtests.test(msg="default nav items"):
+                # Check that nav list exists
+                nav_list = widget.query_one("#nav-list")
+                assert nav_list is not None
 
-            widget.set_playlists([sample_playlist])
+            with subtests.test(msg="set playlists"):
+                widget.set_playlists([sample_playlist])
 
-            assert len(widget.playlists) == 1
-            assert widget.playlists[0]["name"] == "My Test Playlist"
+                assert len(widget.playlists) == 1
+                assert widget.playlists[0]["name"] == "My Test Playlist"
 
-    @pytest.mark.asyncio
-    async def test_sidebar_item_selected_message(self, widget_app: type[App]) -> None:
+    async def test_sidebar_item_selected_message(self) -> None:
         """Test that selecting item emits ItemSelected message."""
-        from spotuify.widgets.sidebar import Sidebar
-
         messages = []
 
         class TestApp(App):
@@ -405,7 +290,7 @@ class TestSidebarWidget:
             # Focus the list and press enter on first item
             nav_list.focus()
             await pilot.press("enter")
-            await pilot.pause()
+            await asyncio.sleep(0)
 
             assert len(messages) >= 1
 
@@ -413,117 +298,67 @@ class TestSidebarWidget:
 class TestDeviceSelectorWidget:
     """Tests for DeviceSelector widget."""
 
-    @pytest.fixture
-    def widget_app(self) -> type[App]:
-        """Create a test app with DeviceSelector widget."""
-        from spotuify.widgets.device_selector import DeviceSelector
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield DeviceSelector(id="devices")
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_device_selector_default_state(self, widget_app: type[App]) -> None:
+    async def test_device_selector_default_state(self, make_widget: Callable[..., Any]) -> None:
         """Test DeviceSelector default state."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#devices")
+        async with make_widget(DeviceSelector, "devices") as widget:
             assert widget.devices == []
             assert widget.active_device_id is None
 
-    @pytest.mark.asyncio
     async def test_device_selector_set_devices(
-        self, widget_app: type[App], sample_devices: list[dict[str, Any]]
+        self, make_widget: Callable[..., Any], sample_devices: tuple[Mapping[str, Any], ...]
     ) -> None:
         """Test setting devices in selector."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#devices")
-
+        async with make_widget(DeviceSelector, "devices") as widget:
             widget.set_devices(sample_devices)
 
             assert len(widget.devices) == 3
             # Active device should be detected
             assert widget.active_device_id == "device123"
 
-    @pytest.mark.asyncio
-    async def test_device_selector_empty_devices(self, widget_app: type[App]) -> None:
+    async def test_device_selector_empty_devices(self, make_widget: Callable[..., Any]) -> None:
         """Test selector with no devices."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#devices")
-
+        async with make_widget(DeviceSelector, "devices") as widget:
             widget.set_devices([])
 
             # No devices label should be visible
-            no_devices = app.query_one("#no-devices")
+            no_devices = widget.query_one("#no-devices")
             assert no_devices.display is True
 
 
 class TestTrackListWidget:
     """Tests for TrackList widget."""
 
-    @pytest.fixture
-    def widget_app(self) -> type[App]:
-        """Create a test app with TrackList widget."""
-        from spotuify.widgets.track_list import TrackList
-
-        class TestApp(App):
-            def compose(self) -> ComposeResult:
-                yield TrackList(id="tracks")
-
-        return TestApp
-
-    @pytest.mark.asyncio
-    async def test_track_list_default_state(self, widget_app: type[App]) -> None:
-        """Test TrackList default state."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#tracks")
-            assert widget.tracks == []
-            assert widget.context_uri is None
-            assert widget.current_track_id is None
-
-    @pytest.mark.asyncio
-    async def test_track_list_set_tracks(
-        self, widget_app: type[App], sample_track_item: dict[str, Any]
+    async def test_track_list_state(
+        self,
+        make_widget: Callable[..., Any],
+        subtests: pytest.Subtests,
+        sample_track_item: Mapping[str, Any],
     ) -> None:
-        """Test setting tracks in list."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#tracks")
+        """Test TrackList default state, set_tracks and set_current_track on one app."""
+        async with make_widget(TrackList, "tracks") as widget:
+            with subtests.test(msg="default state"):
+                assert widget.tracks == []
+                assert widget.context_uri is None
+                assert widget.current_track_id is None
 
-            widget.set_tracks(
-                [sample_track_item],
-                context_uri="spotify:playlist:test123",
-            )
+            with subtests.test(msg="set tracks"):
+                widget.set_tracks(
+                    [sample_track_item],
+                    context_uri="spotify:playlist:test123",
+                )
 
-            assert len(widget.tracks) == 1
-            assert widget.context_uri == "spotify:playlist:test123"
+                assert len(widget.tracks) == 1
+                assert widget.context_uri == "spotify:playlist:test123"
 
-    @pytest.mark.asyncio
-    async def test_track_list_set_current_track(
-        self, widget_app: type[App], sample_track_item: dict[str, Any]
-    ) -> None:
-        """Test setting current playing track."""
-        async with widget_app().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#tracks")
+            with subtests.test(msg="set current track"):
+                widget.set_current_track("track123")
 
-            widget.set_tracks([sample_track_item])
-            widget.set_current_track("track123")
+                assert widget.current_track_id == "track123"
 
-            assert widget.current_track_id == "track123"
-
-    @pytest.mark.asyncio
     async def test_track_list_track_selected_message(
-        self, widget_app: type[App], sample_track_item: dict[str, Any]
+        self, sample_track_item: Mapping[str, Any]
     ) -> None:
         """Test that selecting track emits TrackSelected message."""
-        from spotuify.widgets.track_list import TrackList
-
         messages = []
 
         class TestApp(App):
@@ -534,17 +369,16 @@ class TestTrackListWidget:
                 messages.append(event.track_id)
 
         async with TestApp().run_test() as pilot:
-            app = pilot.app
-            widget = app.query_one("#tracks")
+            widget = pilot.app.query_one("#tracks")
             widget.set_tracks([sample_track_item])
 
             # Wait for render
             await pilot.pause()
 
             # Select the track
-            table = app.query_one("#tracks-table")
+            table = widget.query_one("#tracks-table")
             table.focus()
             await pilot.press("enter")
-            await pilot.pause()
+            await asyncio.sleep(0)
 
             assert "track123" in messages